@@ -21,12 +21,15 @@ async def main():
 
     # Now populate it
 
-    list_of_values = [[67, "My favorite number"], [0, "First natural number"], [3, "Almost pi"]]
+    list_of_values = [(67, "My favorite number"), (0, "First natural number"), (3, "Almost pi")]
 
-    # Below example is a naive synchronous awaiting each execute call
-    # This is suboptimal for large amount of requests and should be avoided
-    for values in list_of_values:
-        await session.execute(f"INSERT INTO {table_name} (id, value) VALUES (?, ?)", values)
+    # Prepare the statement once, so the server parses it a single time and every
+    # insert only sends the bound values.
+    prepared_statement = await session.prepare(f"INSERT INTO {table_name} (id, value) VALUES (?, ?)")
+
+    # Awaiting each execute call one by one would pay a full round-trip per row.
+    # Instead, submit all of them at once and let them run concurrently.
+    await asyncio.gather(*(session.execute(prepared_statement, values) for values in list_of_values))
 
     # Let's see how the table now looks
     result = await session.execute(f"SELECT * FROM {table_name}")
@@ -35,10 +38,7 @@ async def main():
         print(f"value: {row.get('value')}")
         print(f"Rows are deserialized as dicts. Whole row:\n {row}\n")
 
-    # That worked but I want to insert a lot of rows I better prepare the statement
-    prepared_statement = await session.prepare(f"INSERT INTO {table_name} (id, value) VALUES (?, ?)")
-
-    # Also let's:
+    # That worked, but before inserting a lot more rows let's tune the prepared statement:
     # - increase request timeout for query
     # - demand consistency ALL so state is consistent after insertion
 
@@ -47,14 +47,21 @@ async def main():
     # Now we are ready for inserting rows
 
     # This is the important thing - driver is asynchronous which means to take full advantage
-    # of asynchronous execution we need to use it properly using asyncio, as showcased below
-    coroutines = [session.execute(prepared_statement, [i, f"This is number {i}"]) for i in range(10)]
+    # of asynchronous execution we need to use it properly using asyncio, as showcased below.
+    # Bound values are passed as tuples, which are cheaper to build than lists.
+    coroutines = [session.execute(prepared_statement, (i, f"This is number {i}")) for i in range(10)]
     await asyncio.gather(*coroutines)
 
-    # Let's check our table
+    # For bulk writes, execute_many pulls rows lazily from any iterable and keeps
+    # at most `concurrency` requests in flight, so large inputs don't have to be
+    # materialized up front.
+    await session.execute_many(prepared_statement, ((i, f"This is number {i}") for i in range(10, 20)), concurrency=4)
+
+    # Let's check our table. Rows are collected first and written out with
+    # a single print, instead of one blocking write per row.
     result = await session.execute(f"SELECT * FROM {table_name}")
-    async for row in result:
-        print(row)
+    rows = await result.all()
+    print("\n".join(map(str, rows)))
 
     # Now let's create a more complex table
     complex_table_name = "complex_table"
@@ -72,7 +79,7 @@ async def main():
     # Insert some rows
     complex_coroutines = [
         session.execute(
-            complex_prepared, [id, {"Math": (id + 1) % 5 + 1, "Science": (id + 2) % 5 + 1, "English": (id + 3) % 5 + 1}]
+            complex_prepared, (id, {"Math": (id + 1) % 5 + 1, "Science": (id + 2) % 5 + 1, "English": (id + 3) % 5 + 1})
         )
         for id in range(6)
     ]
@@ -80,8 +87,8 @@ async def main():
 
     # See the results
     result = await session.execute(f"SELECT * FROM {complex_table_name}")
-    async for row in result:
-        print(row)
+    rows = await result.all()
+    print("\n".join(map(str, rows)))
 
 
 asyncio.run(main())
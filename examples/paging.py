@@ -10,13 +10,16 @@ This file demonstrates:
   4) Convenience helpers: first_row() and all()
   5) Custom row shaping via RowFactory
 
+Rows are built as dicts by default. Examples which only need values use
+TupleRowFactory, which skips building a dict with column name keys per row.
+
 """
 
 import asyncio
 import os
 from typing import Any, Dict
 
-from scylla.results import ColumnIterator, RowFactory
+from scylla.results import ColumnIterator, RowFactory, TupleRowFactory
 from scylla.session import Session
 from scylla.session_builder import SessionBuilder
 from scylla.statement import Statement
@@ -48,11 +51,9 @@ async def setup_schema(session: Session) -> None:
 
     # Insert a small deterministic dataset.
     # (Re-inserting is fine: primary key makes rows idempotent for the same keys.)
-    for i in range(16):
-        await session.execute(
-            "INSERT INTO select_paging (a, b, c) VALUES (?, ?, 'abc')",
-            (i, 2 * i),
-        )
+    # Prepare once and send all rows in one call; requests run concurrently.
+    insert = await session.prepare("INSERT INTO select_paging (a, b, c) VALUES (?, ?, 'abc')")
+    await session.execute_many(insert, [(i, 2 * i) for i in range(16)])
 
 
 # ----------------------------
@@ -62,11 +63,15 @@ async def example_async_for(session: Session) -> None:
     print("\n=== 1) Async iteration over all rows (auto-paging) ===")
 
     # Unprepared string query (supports str | Statement | PreparedStatement).
-    result = await session.execute("SELECT a, b, c FROM select_paging")
+    result = await session.execute("SELECT a, b, c FROM select_paging", factory=TupleRowFactory())
 
+    # Collect output and print it once, rather than blocking on stdout for every row.
+    lines: list[str] = []
     async for row in result:
-        # Default row representation: dict[str, CqlValue]
-        print(f"row={row}")
+        # Rows are tuples of values in column order: (a, b, c).
+        # Omit `factory` to get the default dict[str, CqlValue] rows.
+        lines.append(f"row={row}")
+    print("\n".join(lines))
 
 
 # ----------------------------
@@ -114,8 +119,9 @@ async def example_manual_paging_prepared(session: Session) -> None:
 
     page_no = 1
     while True:
-        # Consume only the *current* page of size 7 except maybe the last one:
-        page_rows = list(result.iter_current_page())
+        # Consume only the *current* page of size 7 except maybe the last one.
+        # current_page() materializes the whole page as a list in a single call:
+        page_rows = result.current_page()
         print(f"page {page_no}: {len(page_rows)} rows")
 
         if not result.has_more_pages():
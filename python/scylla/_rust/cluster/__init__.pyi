@@ -67,6 +67,10 @@ class ClusterState:
     """
     Represents state of the cluster allowing access to known nodes,
     keyspaces, replica locator and token calculation.
+
+    A `ClusterState` is an immutable snapshot: results computed from it,
+    such as tokens or replica sets, stay valid for as long as the snapshot
+    is the one returned by `Session.cluster_state`.
     """
 
     def get_keyspace(self, keyspace: str) -> Keyspace | None:
@@ -106,6 +106,21 @@ class RowFactory:
         """
         ...
 
+class TupleRowFactory(RowFactory):
+    """
+    Row factory producing each row as a `tuple` of values in column order.
+
+    Cheaper than the default `dict` rows, as no per-row dictionary
+    or column name keys are created.
+    """
+
+    def __init__(self) -> None: ...
+    def build(self, column_iterator: ColumnIterator) -> Tuple[CqlValue, ...]:  # pyright: ignore[reportIncompatibleMethodOverride]
+        """
+        Build a row tuple from the provided column iterator.
+        """
+        ...
+
 class Column:
     """
     Represents a single column in a result row.
@@ -218,6 +233,15 @@ class RequestResult:
         """
         ...
 
+    def current_page(self) -> List[Any]:
+        """
+        Returns all rows in the current page as a list.
+
+        Equivalent to `list(iter_current_page())`, but rows are materialized
+        in a single call. Does not fetch additional pages.
+        """
+        ...
+
     def __aiter__(self) -> AsyncRowsIterator: ...
     async def first_row(self) -> Any | None:
         """
@@ -242,6 +266,10 @@ class RequestResult:
         This method eagerly fetches all remaining pages and materializes
         the entire result set in memory. It should be used with care
         for large queries.
+
+        For prepared statements and statements without bound values, the request
+        for each following page is sent before rows of the current page are
+        materialized, so fetching overlaps with deserialization.
         """
         ...
 
@@ -1,5 +1,5 @@
 import uuid
-from typing import Any
+from typing import Any, Iterable
 
 from .batch import Batch
 from .cluster import ClusterState
@@ -15,6 +15,10 @@ class Session:
     def cluster_state(self) -> ClusterState:
         """
         Access information about the cluster topology or schema through ClusterState object.
+
+        The returned object is an immutable snapshot. The same object is returned
+        until the driver observes a topology or schema change, so it can be used
+        as a cache key for values derived from it (e.g. computed tokens).
         """
         ...
     async def use_keyspace(self, keyspace: str, case_sensitive: bool = False) -> None:
@@ -84,6 +88,50 @@ class Session:
         """
         ...
 
+    async def execute_many(
+        self,
+        statement: PreparedStatement,
+        values: Iterable[Any],
+        /,
+        *,
+        concurrency: int = 256,
+    ) -> None:
+        """
+        Execute a prepared statement once for every row of values.
+
+        Requests are sent concurrently from the driver's runtime, without
+        returning to Python for every row. Rows are pulled from `values` lazily,
+        as request slots free up, so generators can be used to stream large inputs
+        with bounded memory. Results are discarded, which makes this suitable for
+        bulk writes. Cancelling the call aborts requests that are still in flight.
+
+        Parameters
+        ----------
+        statement : PreparedStatement
+            The prepared statement to execute.
+        values : Iterable[Any]
+            Rows of parameters, each bound to the statement like `values` in `execute`.
+        concurrency : int, optional
+            Maximum number of requests in flight at the same time. Must be positive.
+            Default is 256.
+
+        Raises
+        ------
+        ExecuteError
+            If a row's values fail to serialize, or if any of the requests fails.
+            No new rows are submitted after a failure, and requests already
+            in flight are completed before the first error is raised.
+        TypeError
+            If `values` is not iterable, or if a row is not a tuple, list or mapping.
+            A bad row stops the call in the same way as an `ExecuteError`.
+        Exception
+            Any exception raised by the `values` iterator is propagated unchanged,
+            after requests already in flight are completed.
+        ValueError
+            If `concurrency` is zero.
+        """
+        ...
+
     async def batch(
         self,
         batch: Batch,
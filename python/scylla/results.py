@@ -1,6 +1,7 @@
 from ._rust.results import (  # pyright: ignore[reportMissingModuleSource]
     SinglePageIterator,
     RowFactory,
+    TupleRowFactory,
     RequestResult,
     ColumnIterator,
     Column,
@@ -10,6 +11,7 @@ from ._rust.results import (  # pyright: ignore[reportMissingModuleSource]
 
 __all__ = [
     "RowFactory",
+    "TupleRowFactory",
     "SinglePageIterator",
     "RequestResult",
     "Column",
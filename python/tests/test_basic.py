@@ -13,4 +13,4 @@ async def test_cluster_connect():
 async def test_simple_query():
     session = await SessionBuilder().contact_points([("127.0.0.2", 9042)]).connect()
     result = await session.execute("SELECT * FROM system.local")
-    print(result)
+    assert await result.first_row() is not None
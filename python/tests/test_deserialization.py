@@ -1,16 +1,17 @@
 import datetime
 import ipaddress
 import math
+import struct
 import uuid
 from datetime import time
 from decimal import Decimal
-from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Set, Tuple
+from typing import Any, AsyncGenerator, Awaitable, Callable, ClassVar, Dict, List, Set, Tuple
 
 import pytest
 import pytest_asyncio
 from dateutil.relativedelta import relativedelta
 from scylla._rust.errors import DeserializationError, RowIterationError  # pyright: ignore[reportMissingModuleSource]
-from scylla._rust.results import ColumnIterator, RowFactory  # pyright: ignore[reportMissingModuleSource]
+from scylla._rust.results import ColumnIterator, RowFactory, TupleRowFactory  # pyright: ignore[reportMissingModuleSource]
 from scylla._rust.session import Session  # pyright: ignore[reportMissingModuleSource]
 from scylla._rust.session_builder import SessionBuilder  # pyright: ignore[reportMissingModuleSource]
 from scylla._rust.value import CqlEmpty  # pyright: ignore[reportMissingModuleSource]
@@ -39,21 +40,32 @@ async def session():
 
 TableFactory = Callable[[str, str], Awaitable[str]]
 
+_FLOAT32 = struct.Struct("f")
 
-@pytest_asyncio.fixture
+
+def to_float32(val: float) -> float:
+    # Pack as 32-bit float (f), then unpack back to Python float
+    return _FLOAT32.unpack(_FLOAT32.pack(val))[0]
+
+
+# Tables are shared by all parametrize cases of a test (each case uses its own row_id)
+# and are dropped together with the keyspace at module teardown. Reusing a table name
+# with a different schema is a test bug, so it raises.
+@pytest_asyncio.fixture(scope="module")
 async def table_factory(session: Session) -> AsyncGenerator[TableFactory, None]:
-    created_tables: list[str] = []
+    created_tables: dict[str, str] = {}
 
     async def create_table(schema: str, name: str) -> str:
-        await session.execute(f"CREATE TABLE IF NOT EXISTS {name} ({schema});")
-        created_tables.append(name)
+        existing_schema = created_tables.get(name)
+        if existing_schema is None:
+            await session.execute(f"CREATE TABLE IF NOT EXISTS {name} ({schema});")
+            created_tables[name] = schema
+        elif existing_schema != schema:
+            raise ValueError(f"Table {name} was already created with schema ({existing_schema}), got ({schema})")
         return name
 
     yield create_table
 
-    for table in created_tables:
-        await session.execute(f"DROP TABLE IF EXISTS {table};")
-
 
 async def insert_and_fetch_single_row(
     session: Session,
@@ -141,12 +153,6 @@ async def test_float_deserialization(
     value_sql: str,
     expected: float,
 ):
-    def to_float32(val: float) -> float:
-        import struct
-
-        # Pack as 32-bit float (f), then unpack back to Python float
-        return struct.unpack("f", struct.pack("f", val))[0]
-
     row = await insert_and_fetch_single_row(
         session=session,
         table_factory=table_factory,
@@ -249,6 +255,20 @@ async def test_nested_list_deserialization(
     assert nested == value
 
 
+@pytest_asyncio.fixture(scope="module")
+async def address_udt(session: Session) -> str:
+    # The type is created once per module and shared by the UDT tests.
+    await session.execute(
+        """
+        CREATE TYPE IF NOT EXISTS address (
+            street text,
+            number int
+        )
+        """
+    )
+    return "address"
+
+
 # Verifies correct deserialization of CQL UDT into Python dictionaries
 @pytest.mark.asyncio
 @pytest.mark.requires_db
@@ -270,24 +290,15 @@ async def test_nested_list_deserialization(
 async def test_udt_deserialization(
     session: Session,
     table_factory: TableFactory,
+    address_udt: str,
     row_id: int,
     value_sql: str,
     expected: Dict[str, int],
 ):
-    # Create UDT (safe to re-run)
-    await session.execute(
-        """
-        CREATE TYPE IF NOT EXISTS testks.address (
-            street text,
-            number int
-        )
-        """
-    )
-
     row = await insert_and_fetch_single_row(
         session=session,
         table_factory=table_factory,
-        schema="id int PRIMARY KEY, value address",
+        schema=f"id int PRIMARY KEY, value {address_udt}",
         table_name="udt_table",
         row_id=row_id,
         value_sql=value_sql,
@@ -300,15 +311,11 @@ async def test_udt_deserialization(
 # Verifies correct deserialization of list<frozen<UDT>> across multiple rows
 @pytest.mark.asyncio
 @pytest.mark.requires_db
-async def test_list_udt_deserialization(session: Session, table_factory: TableFactory):
-    await session.execute("""
-        CREATE TYPE IF NOT EXISTS testks.address (
-            street text,
-            number int
-        );
-    """)
-
-    table = await table_factory("id int, name text, addrs list<frozen<address>>, PRIMARY KEY (id, name)", "nested_udt")
+async def test_list_udt_deserialization(session: Session, table_factory: TableFactory, address_udt: str):
+    table = await table_factory(
+        f"id int, name text, addrs list<frozen<{address_udt}>>, PRIMARY KEY (id, name)",
+        "nested_udt",
+    )
 
     # 3. Insert multiple rows with list<udt>
     rows_to_insert = 9  # 10–15 as requested
@@ -355,19 +362,15 @@ async def test_custom_row_factory_transforms_rows(session: Session, table_factor
     # A valid RowFactory implementation
     class UserFactory(RowFactory):
         cls = UserRow
+        field_converters: ClassVar[Dict[str, Callable[[Any], Any]]] = {"id": int, "name": str, "scores": list}
 
         def build(self, column_iterator: ColumnIterator) -> Any:
-            id = 0
-            name = "Some"
-            scores = []
+            values: Dict[str, Any] = {"id": 0, "name": "Some", "scores": []}
             for col in column_iterator:
-                if col.column_name == "id":
-                    id = int(col.value)  # type: ignore[arg-type]
-                elif col.column_name == "name":
-                    name = str(col.value)  # type: ignore[arg-type]
-                elif col.column_name == "scores":
-                    scores = list(col.value)  # type: ignore[arg-type]
-            return UserRow(id, name, scores)  # type: ignore[arg-type]
+                converter = self.field_converters.get(col.column_name)
+                if converter is not None:
+                    values[col.column_name] = converter(col.value)
+            return UserRow(**values)
 
     # Create table
     table = await table_factory("id int PRIMARY KEY, name text, scores list<int>", "example_table")
@@ -395,14 +398,28 @@ async def test_custom_row_factory_transforms_rows(session: Session, table_factor
     assert bob.scores == [5, 10]
 
 
+# Verifies that TupleRowFactory yields rows as tuples in column order
+@pytest.mark.asyncio
+@pytest.mark.requires_db
+async def test_tuple_row_factory(session: Session, table_factory: TableFactory):
+    table = await table_factory("id int PRIMARY KEY, name text, scores list<int>", "tuple_factory_table")
+
+    await session.execute(f"INSERT INTO {table} (id, name, scores) VALUES (1, 'Alice', [1, 2, 3]);")
+
+    result = await session.execute(f"SELECT id, name, scores FROM {table}", factory=TupleRowFactory())
+    row = await result.first_row()
+
+    assert row == (1, "Alice", [1, 2, 3])
+
+
 # Verifies correct deserialization of CQL uuid into Python UUID
 @pytest.mark.asyncio
 @pytest.mark.requires_db
 @pytest.mark.parametrize(
     "row_id,value",
     [
-        (1, uuid.uuid4()),
-        (2, uuid.uuid4()),
+        (1, uuid.UUID("f47ac10b-58cc-4372-a567-0e02b2c3d479")),
+        (2, uuid.UUID("9b2f6c3e-1d4a-4e8b-b7c2-5a0f3d9e6a81")),
     ],
 )
 async def test_uuid_deserialization(
@@ -460,8 +477,8 @@ async def test_inet_deserialization(
 @pytest.mark.parametrize(
     "row_id,value",
     [
-        (1, uuid.uuid1()),
-        (2, uuid.uuid1()),
+        (1, uuid.UUID("6ba7b810-9dad-11d1-80b4-00c04fd430c8")),
+        (2, uuid.UUID("e3e70682-c209-11ee-8b2a-0242ac120002")),
     ],
 )
 async def test_timeuuid_deserialization(
@@ -929,7 +946,44 @@ async def test_vector_4_deserialization(
     )
 
     assert isinstance(row["value"], list)
-    assert row["value"] == pytest.approx(expected)  # pyright: ignore[reportUnknownMemberType]
+    assert row["value"] == [to_float32(x) for x in expected]
+
+
+# Verifies correct deserialization of fixed-size CQL vectors of double, int and bigint
+@pytest.mark.asyncio
+@pytest.mark.requires_db
+@pytest.mark.parametrize(
+    "row_id,element_type,value_literal,expected",
+    [
+        (1, "double", "[3.141592653589793,-0.5,1e300,0.0]", [3.141592653589793, -0.5, 1e300, 0.0]),
+        (2, "int", "[1,-2,2147483647,-2147483648]", [1, -2, 2**31 - 1, -(2**31)]),
+        (
+            3,
+            "bigint",
+            "[1099511627776,-1,9223372036854775807,-9223372036854775808]",
+            [2**40, -1, 2**63 - 1, -(2**63)],
+        ),
+    ],
+)
+async def test_vector_4_numeric_deserialization(
+    session: Session,
+    table_factory: TableFactory,
+    row_id: int,
+    element_type: str,
+    value_literal: str,
+    expected: list[int] | list[float],
+):
+    row = await insert_and_fetch_single_row(
+        session,
+        table_factory,
+        schema=f"id int PRIMARY KEY, value vector<{element_type},4>",
+        table_name=f"vec4_{element_type}_table",
+        row_id=row_id,
+        value_sql=value_literal,
+    )
+
+    assert isinstance(row["value"], list)
+    assert row["value"] == expected
 
 
 # Verifies correct handling of NULL values in CQL Collections
@@ -1024,6 +1078,21 @@ async def test_tuple_with_null_elements_deserialization(
     assert row["value"] == expected
 
 
+@pytest_asyncio.fixture(scope="module")
+async def nullable_udt(session: Session) -> str:
+    await session.execute(
+        """
+        CREATE TYPE IF NOT EXISTS udt_null_test (
+            a int,
+            b text,
+            c boolean,
+            d double
+        )
+        """
+    )
+    return "udt_null_test"
+
+
 # Verifies correct handling of NULL UDT and NULL elements inside CQL UDT
 @pytest.mark.asyncio
 @pytest.mark.requires_db
@@ -1045,26 +1114,15 @@ async def test_tuple_with_null_elements_deserialization(
 async def test_udt_with_null_fields_deserialization(
     session: Session,
     table_factory: TableFactory,
+    nullable_udt: str,
     row_id: int,
     value_sql: str,
     expected: Dict[str, Any],
 ):
-    # Create UDT
-    await session.execute(
-        """
-        CREATE TYPE IF NOT EXISTS udt_null_test (
-            a int,
-            b text,
-            c boolean,
-            d double
-        )
-        """
-    )
-
     row = await insert_and_fetch_single_row(
         session=session,
         table_factory=table_factory,
-        schema="id int PRIMARY KEY, value frozen<udt_null_test>",
+        schema=f"id int PRIMARY KEY, value frozen<{nullable_udt}>",
         table_name="udt_null_elem_table",
         row_id=row_id,
         value_sql=value_sql,
@@ -67,7 +67,7 @@ async def test_create_session_with_profile():
     profile = ExecutionProfile(timeout=expected_timeout, consistency=expected_consistency)
     session = await SessionBuilder().contact_points([("127.0.0.2", 9042)]).execution_profile(profile).connect()
     result = await session.execute("SELECT * FROM system.local")
-    print(result)
+    assert await result.first_row() is not None
 
 
 @pytest.mark.asyncio
@@ -127,6 +127,30 @@ async def test_execute_paged_basic_flow_for_unprepared_statements(
     assert sorted(seen_ids) == list(range(total_rows))
 
 
+@pytest.mark.asyncio
+@pytest.mark.requires_db
+@pytest.mark.parametrize("total_rows,page_size", [(25, 10), (20, 100), (0, 10)])
+async def test_current_page_matches_iter_current_page(
+    session: Session, table_factory: TableFactory, total_rows: int, page_size: int
+):
+    table = await table_factory(
+        "id int PRIMARY KEY, x int",
+        "paging_current_page_table",
+    )
+
+    await insert_rows(session, table, total_rows)
+
+    prepared = await session.prepare(f"SELECT * FROM {table}")
+    prepared = prepared.with_page_size(page_size)
+
+    paging_result = await session.execute(prepared)
+
+    page = paging_result.current_page()
+    assert isinstance(page, list)
+    assert page == list(paging_result.iter_current_page())
+    assert len(page) == min(total_rows, page_size)
+
+
 @pytest.mark.asyncio
 @pytest.mark.requires_db
 @pytest.mark.parametrize(
@@ -264,6 +288,40 @@ async def test_paging_all_returns_all_rows(
     assert sorted(ids) == list(range(total_rows))
 
 
+# Covers both fetching the next page while all() drains the current one
+# (prepared statements, statements without values) and fetching it afterwards
+# (unprepared statements with bound values).
+@pytest.mark.asyncio
+@pytest.mark.requires_db
+@pytest.mark.parametrize("prepare", [True, False])
+@pytest.mark.parametrize("bind_values", [True, False])
+async def test_paging_all_preserves_order_across_pages(
+    session: Session,
+    table_factory: TableFactory,
+    prepare: bool,
+    bind_values: bool,
+):
+    table = await table_factory(
+        "pk int, ck int, x int, PRIMARY KEY (pk, ck)",
+        "paging_all_order_table",
+    )
+
+    insert = await session.prepare(f"INSERT INTO {table} (pk, ck, x) VALUES (0, ?, ?)")
+    await session.execute_many(insert, [(i, i * 10) for i in range(25)])
+
+    if bind_values:
+        query, values = f"SELECT ck, x FROM {table} WHERE pk = ?", (0,)
+    else:
+        query, values = f"SELECT ck, x FROM {table} WHERE pk = 0", None
+
+    statement = (await session.prepare(query)) if prepare else Statement(query)
+    result = await session.execute(statement.with_page_size(10), values)
+
+    rows = await result.all()
+
+    assert [(row["ck"], row["x"]) for row in rows] == [(i, i * 10) for i in range(25)]
+
+
 @pytest.mark.asyncio
 @pytest.mark.requires_db
 async def test_paging_one_returns_none_for_empty_result(
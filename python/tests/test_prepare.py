@@ -1,30 +1,34 @@
 import pytest
+import pytest_asyncio
+from scylla.session import Session
 from scylla.session_builder import SessionBuilder
 from scylla.statement import PreparedStatement
 
 
+@pytest_asyncio.fixture(scope="module")
+async def session():
+    return await SessionBuilder().contact_points([("127.0.0.2", 9042)]).connect()
+
+
 @pytest.mark.asyncio
 @pytest.mark.requires_db
-async def test_prepare_statement():
-    session = await SessionBuilder().contact_points([("127.0.0.2", 9042)]).connect()
+async def test_prepare_statement(session: Session):
     prepared = await session.prepare("SELECT * FROM system.local")
-    print(prepared)
+    assert isinstance(prepared, PreparedStatement)
 
 
 @pytest.mark.asyncio
 @pytest.mark.requires_db
-async def test_prepare_and_execute():
-    session = await SessionBuilder().contact_points([("127.0.0.2", 9042)]).connect()
+async def test_prepare_and_execute(session: Session):
     prepared = await session.prepare("SELECT * FROM system.local")
     assert isinstance(prepared, PreparedStatement)
     result = await session.execute(prepared)
-    print(result)
+    assert await result.first_row() is not None
 
 
 @pytest.mark.asyncio
 @pytest.mark.requires_db
-async def test_prepare_and_str():
-    session = await SessionBuilder().contact_points([("127.0.0.2", 9042)]).connect()
+async def test_prepare_and_str(session: Session):
     query_str = "SELECT cluster_name FROM system.local"
     prepared = await session.prepare(query_str)
     result_prepared = await session.execute(prepared)
@@ -34,9 +38,7 @@ async def test_prepare_and_str():
 
 @pytest.mark.asyncio
 @pytest.mark.requires_db
-async def test_prepared_with_and_get_page_size():
-    session = await SessionBuilder().contact_points([("127.0.0.2", 9042)]).connect()
-
+async def test_prepared_with_and_get_page_size(session: Session):
     prepared = await session.prepare("SELECT * FROM system.local")
 
     expected_page_size = 500
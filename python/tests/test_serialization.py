@@ -3,7 +3,7 @@ import uuid
 from dataclasses import asdict, dataclass
 from datetime import date, datetime, time, timezone
 from decimal import Decimal
-from typing import AsyncGenerator, Awaitable, Callable, List, Optional, Tuple
+from typing import AsyncGenerator, Awaitable, Callable, List, Optional, Set, Tuple
 
 import pytest
 import pytest_asyncio
@@ -54,7 +54,7 @@ async def table_factory(session: Session) -> AsyncGenerator[TableFactory, None]:
         await session.execute(f"DROP TABLE IF EXISTS {table};")
 
 
-@dataclass
+@dataclass(slots=True)
 class Address:
     """Example UDT class for address"""
 
@@ -62,11 +62,8 @@ class Address:
     city: str
     zip_code: int
 
-    def to_dict(self):
-        return {"street": self.street, "city": self.city, "zip_code": self.zip_code}
-
 
-@dataclass
+@dataclass(slots=True)
 class Person:
     """Example UDT class for person"""
 
@@ -74,13 +71,6 @@ class Person:
     age: int
     address: Address
 
-    def to_dict(self):
-        return {
-            "name": self.name,
-            "age": self.age,
-            "address": self.address.to_dict() if self.address else None,
-        }
-
 
 @pytest.mark.asyncio
 @pytest.mark.requires_db
@@ -456,8 +446,8 @@ async def test_varint_serialization(session: Session, table_factory: TableFactor
         -123456789012345678901234567890,
     ]
 
-    for i, val in enumerate(values):
-        await session.execute(f"INSERT INTO {table} (id, col) VALUES (?, ?)", (i, val))
+    insert = await session.prepare(f"INSERT INTO {table} (id, col) VALUES (?, ?)")
+    await session.execute_many(insert, enumerate(values))
 
     await session.execute(f"SELECT * from {table}")
 
@@ -568,6 +558,49 @@ async def test_vector_serialization_tuple(session: Session, table_factory: Table
     await session.execute(f"SELECT * from {table}")
 
 
+@pytest.mark.asyncio
+@pytest.mark.requires_db
+@pytest.mark.parametrize(
+    "element_type,vector",
+    [
+        ("int", [1, -2, 2**31 - 1, -(2**31)]),
+        ("bigint", [2**40, -1, 2**63 - 1, -(2**63)]),
+        ("float", [1.0, 2.5, -3.0, 4.25]),
+        ("double", [3.141592653589793, -0.00000012345, 1e300, 0.0]),
+    ],
+)
+async def test_vector_serialization_round_trip(
+    session: Session,
+    table_factory: TableFactory,
+    element_type: str,
+    vector: List[int] | List[float],
+):
+    table = await table_factory(
+        f"id int PRIMARY KEY, embedding vector<{element_type}, 4>",
+        f"vector_{element_type}_table",
+    )
+
+    await session.execute(f"INSERT INTO {table} (id, embedding) VALUES (?, ?)", (1, vector))
+
+    result = await session.execute(f"SELECT embedding FROM {table} WHERE id = 1")
+    row = await result.first_row()
+
+    assert row is not None
+    assert row["embedding"] == vector
+
+
+@pytest.mark.asyncio
+@pytest.mark.requires_db
+async def test_vector_serialization_rejects_wrong_length(session: Session, table_factory: TableFactory):
+    table = await table_factory(
+        "id int PRIMARY KEY, embedding vector<float, 4>",
+        "vector_wrong_length_table",
+    )
+
+    with pytest.raises(ExecuteError):
+        await session.execute(f"INSERT INTO {table} (id, embedding) VALUES (?, ?)", (1, [1.0, 2.0, 3.0]))
+
+
 @pytest.mark.asyncio
 @pytest.mark.requires_db
 async def test_list_serialization(session: Session, table_factory: TableFactory):
@@ -583,12 +616,103 @@ async def test_list_serialization(session: Session, table_factory: TableFactory)
         (4, ["test", "with", "spaces"], [0, -1, 999]),
     ]
 
-    for values in test_cases:
-        await session.execute(f"INSERT INTO {table} (id, tags, scores) VALUES (?, ?, ?)", values)
+    insert = await session.prepare(f"INSERT INTO {table} (id, tags, scores) VALUES (?, ?, ?)")
+    await session.execute_many(insert, test_cases)
 
     await session.execute(f"SELECT * from {table}")
 
 
+@pytest.mark.asyncio
+@pytest.mark.requires_db
+@pytest.mark.parametrize(
+    "element_type,collection,value",
+    [
+        ("int", "list", [1, -2, 2**31 - 1, -(2**31)]),
+        ("bigint", "list", [2**40, -1, 2**63 - 1, -(2**63)]),
+        ("float", "list", [1.0, 2.5, -3.0, 4.25]),
+        ("double", "list", [3.141592653589793, -0.00000012345, 1e300]),
+        ("int", "set", {1, -2, 2**31 - 1}),
+        ("bigint", "set", {2**40, -(2**63)}),
+        ("float", "set", {0.5, -2.25}),
+        ("double", "set", {0.5, -1e300}),
+    ],
+)
+async def test_fixed_width_collection_serialization_round_trip(
+    session: Session,
+    table_factory: TableFactory,
+    element_type: str,
+    collection: str,
+    value: List[int] | List[float] | Set[int] | Set[float],
+):
+    table = await table_factory(
+        f"id int PRIMARY KEY, col {collection}<{element_type}>",
+        f"{collection}_{element_type}_table",
+    )
+
+    await session.execute(f"INSERT INTO {table} (id, col) VALUES (?, ?)", (1, value))
+
+    result = await session.execute(f"SELECT col FROM {table} WHERE id = 1")
+    row = await result.first_row()
+
+    assert row is not None
+    assert row["col"] == value
+
+
+@pytest.mark.asyncio
+@pytest.mark.requires_db
+@pytest.mark.parametrize(
+    "collection_type,value",
+    [
+        ("list<int>", [1, 2**31]),
+        ("list<bigint>", [2**63]),
+        ("set<int>", {-(2**31) - 1}),
+    ],
+)
+async def test_fixed_width_collection_serialization_overflow(
+    session: Session,
+    table_factory: TableFactory,
+    collection_type: str,
+    value: List[int] | Set[int],
+):
+    table = await table_factory(
+        f"id int PRIMARY KEY, col {collection_type}",
+        "fixed_width_collection_overflow_table",
+    )
+
+    with pytest.raises(ExecuteError) as exc_info:
+        await session.execute(f"INSERT INTO {table} (id, col) VALUES (?, ?)", (1, value))
+
+    assert "value overflow during serialization" in str(exc_info.value).lower()
+
+
+# bool is an int subclass in Python, but is not accepted for integer columns,
+# neither as a single value nor as a collection element.
+@pytest.mark.asyncio
+@pytest.mark.requires_db
+@pytest.mark.parametrize(
+    "column_type,value",
+    [
+        ("int", True),
+        ("list<int>", [1, True]),
+        ("list<bigint>", [False]),
+        ("set<int>", {True}),
+    ],
+)
+async def test_integer_serialization_rejects_bool(
+    session: Session,
+    table_factory: TableFactory,
+    column_type: str,
+    value: bool | List[int] | Set[int],
+):
+    table = await table_factory(
+        f"id int PRIMARY KEY, col {column_type}",
+        "integer_bool_table",
+    )
+
+    with pytest.raises(ExecuteError):
+        await session.execute(f"INSERT INTO {table} (id, col) VALUES (?, ?)", (1, value))
+
+
 @pytest.mark.asyncio
 @pytest.mark.requires_db
 async def test_list_serialization_rejects_tuple(
@@ -630,8 +754,8 @@ async def test_tuple_serialization(session: Session, table_factory: TableFactory
         (4, ("test", "with", "spaces"), (0, -1, 999)),
     ]
 
-    for values in test_cases:
-        await session.execute(f"INSERT INTO {table} (id, tags, scores) VALUES (?, ?, ?)", values)
+    insert = await session.prepare(f"INSERT INTO {table} (id, tags, scores) VALUES (?, ?, ?)")
+    await session.execute_many(insert, test_cases)
 
     await session.execute(f"SELECT * from {table}")
 
@@ -677,8 +801,8 @@ async def test_null_values(session: Session, table_factory: TableFactory):
         (4, "Null in list", 2.5, None),
     ]
 
-    for values in test_cases:
-        await session.execute(f"INSERT INTO {table} (id, name, score, tags) VALUES (?, ?, ?, ?)", values)
+    insert = await session.prepare(f"INSERT INTO {table} (id, name, score, tags) VALUES (?, ?, ?, ?)")
+    await session.execute_many(insert, test_cases)
 
     await session.execute(f"SELECT * from {table}")
 
@@ -765,12 +889,6 @@ async def test_udt_with_lists(session: Session, table_factory: TableFactory):
             previous_streets list<text>
         )
     """)
-    await session.execute("""
-        CREATE TABLE IF NOT EXISTS users_test (
-            id int PRIMARY KEY,
-            addr frozen<address_test>
-        )
-    """)
 
     table = await table_factory(
         "id int PRIMARY KEY, addr frozen<address_test>",
@@ -789,9 +907,9 @@ async def test_udt_with_lists(session: Session, table_factory: TableFactory):
     await session.execute(f"SELECT * from {table}")
 
 
-@pytest.mark.asyncio
-@pytest.mark.requires_db
-async def test_nested_udts(session: Session, table_factory: TableFactory):
+@pytest_asyncio.fixture(scope="module")
+async def nested_udt(session: Session) -> str:
+    # Types are created once per module and shared by the nested UDT tests.
     inner_udt = "address_inner"
     outer_udt = "person_outer"
 
@@ -811,8 +929,14 @@ async def test_nested_udts(session: Session, table_factory: TableFactory):
         )
     """)
 
+    return outer_udt
+
+
+@pytest.mark.asyncio
+@pytest.mark.requires_db
+async def test_nested_udts(session: Session, table_factory: TableFactory, nested_udt: str):
     table = await table_factory(
-        f"id int PRIMARY KEY, person frozen<{outer_udt}>",
+        f"id int PRIMARY KEY, person frozen<{nested_udt}>",
         "nested_udts_table",
     )
 
@@ -832,3 +956,62 @@ async def test_nested_udts(session: Session, table_factory: TableFactory):
 
     await session.execute(f"INSERT INTO {table} (id, person) VALUES (?, ?)", (2, asdict(person)))
     await session.execute(f"SELECT * from {table}")
+
+
+@pytest.mark.asyncio
+@pytest.mark.requires_db
+async def test_nested_udts_from_dataclass_instances(session: Session, table_factory: TableFactory, nested_udt: str):
+    table = await table_factory(
+        f"id int PRIMARY KEY, person frozen<{nested_udt}>",
+        "nested_udts_dataclass_table",
+    )
+
+    # Dataclass instances are accepted directly, without `asdict()`.
+    person = Person("Bob", 40, Address("456 Oak Ave", "Springfield", 67890))
+
+    await session.execute(f"INSERT INTO {table} (id, person) VALUES (?, ?)", (1, person))
+    result = await session.execute(f"SELECT person FROM {table} WHERE id = 1")
+    row = await result.first_row()
+
+    assert row is not None
+    assert row["person"] == asdict(person)
+
+
+@dataclass
+class AddressWithoutZipCode:
+    street: str
+    city: str
+
+
+@pytest.mark.asyncio
+@pytest.mark.requires_db
+async def test_nested_udts_from_dataclass_missing_field(session: Session, table_factory: TableFactory, nested_udt: str):
+    table = await table_factory(
+        f"id int PRIMARY KEY, person frozen<{nested_udt}>",
+        "nested_udts_dataclass_table",
+    )
+
+    person = Person("Bob", 40, AddressWithoutZipCode("456 Oak Ave", "Springfield"))  # type: ignore[arg-type]
+
+    with pytest.raises(ExecuteError) as exc_info:
+        await session.execute(f"INSERT INTO {table} (id, person) VALUES (?, ?)", (1, person))
+
+    # The error names the dataclass that was passed, not `dict`.
+    assert "AddressWithoutZipCode" in str(exc_info.value)
+    assert "zip_code" in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+@pytest.mark.requires_db
+async def test_nested_udts_from_dataclass_wrong_field_type(
+    session: Session, table_factory: TableFactory, nested_udt: str
+):
+    table = await table_factory(
+        f"id int PRIMARY KEY, person frozen<{nested_udt}>",
+        "nested_udts_dataclass_table",
+    )
+
+    person = Person("Bob", 40, Address("456 Oak Ave", "Springfield", "67890"))  # type: ignore[arg-type]
+
+    with pytest.raises(ExecuteError):
+        await session.execute(f"INSERT INTO {table} (id, person) VALUES (?, ?)", (1, person))
@@ -1,7 +1,9 @@
 import uuid
+from typing import AsyncGenerator, Awaitable, Callable
 
 import pytest
 import pytest_asyncio
+from scylla.errors import ExecuteError
 from scylla.session import Session
 from scylla.session_builder import SessionBuilder
 
@@ -26,6 +28,24 @@ async def session():
     await session.execute("DROP KEYSPACE testks")
 
 
+TableFactory = Callable[[str, str], Awaitable[str]]
+
+
+@pytest_asyncio.fixture
+async def table_factory(session: Session) -> AsyncGenerator[TableFactory, None]:
+    created_tables: list[str] = []
+
+    async def create_table(schema: str, name: str) -> str:
+        await session.execute(f"CREATE TABLE IF NOT EXISTS {name} ({schema});")
+        created_tables.append(name)
+        return name
+
+    yield create_table
+
+    for table in created_tables:
+        await session.execute(f"DROP TABLE IF EXISTS {table};")
+
+
 @pytest.mark.asyncio
 @pytest.mark.requires_db
 async def test_check_schema_agreement_returns_schema_version_or_none(session: Session):
@@ -41,3 +61,105 @@ async def test_await_schema_agreement_returns_schema_version(session: Session):
 
     assert isinstance(schema_version, uuid.UUID)
     assert schema_version
+
+
+@pytest.mark.asyncio
+@pytest.mark.requires_db
+async def test_execute_many_inserts_all_rows(session: Session, table_factory: TableFactory):
+    table = await table_factory("id int PRIMARY KEY, value text", "execute_many_table")
+
+    prepared = await session.prepare(f"INSERT INTO {table} (id, value) VALUES (?, ?)")
+    await session.execute_many(prepared, ((i, f"value {i}") for i in range(50)))
+
+    result = await session.execute(f"SELECT id, value FROM {table}")
+    rows = await result.all()
+
+    assert sorted((row["id"], row["value"]) for row in rows) == [(i, f"value {i}") for i in range(50)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.requires_db
+@pytest.mark.parametrize("concurrency", [1, 7])
+async def test_execute_many_with_bounded_concurrency(session: Session, table_factory: TableFactory, concurrency: int):
+    table = await table_factory("id int PRIMARY KEY", "execute_many_bounded_table")
+
+    prepared = await session.prepare(f"INSERT INTO {table} (id) VALUES (?)")
+    await session.execute_many(prepared, ((i,) for i in range(20)), concurrency=concurrency)
+
+    result = await session.execute(f"SELECT id FROM {table}")
+    rows = await result.all()
+
+    assert sorted(row["id"] for row in rows) == list(range(20))
+
+
+@pytest.mark.asyncio
+@pytest.mark.requires_db
+async def test_execute_many_stops_at_row_that_fails_to_serialize(session: Session, table_factory: TableFactory):
+    table = await table_factory("id int PRIMARY KEY, value text", "execute_many_bad_row_table")
+
+    prepared = await session.prepare(f"INSERT INTO {table} (id, value) VALUES (?, ?)")
+    rows = [(1, "one"), ("two", "two"), (3, "three")]
+
+    with pytest.raises(ExecuteError):
+        await session.execute_many(prepared, rows, concurrency=1)
+
+    # Rows after the failing one are never pulled from the iterable.
+    result = await session.execute(f"SELECT id FROM {table}")
+    assert [row["id"] for row in await result.all()] == [1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.requires_db
+async def test_execute_many_raises_when_server_rejects_row(session: Session, table_factory: TableFactory):
+    table = await table_factory("id int PRIMARY KEY, value text", "execute_many_rejected_table")
+
+    prepared = await session.prepare(f"INSERT INTO {table} (id, value) VALUES (?, ?)")
+    # A null partition key serializes fine, but is rejected by the server.
+    rows = [(1, "one"), (None, "null key")]
+
+    with pytest.raises(ExecuteError):
+        await session.execute_many(prepared, rows, concurrency=1)
+
+    result = await session.execute(f"SELECT id FROM {table}")
+    assert [row["id"] for row in await result.all()] == [1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.requires_db
+async def test_execute_many_stops_after_server_rejects_row(session: Session, table_factory: TableFactory):
+    table = await table_factory("id int PRIMARY KEY, value text", "execute_many_rejected_first_table")
+
+    prepared = await session.prepare(f"INSERT INTO {table} (id, value) VALUES (?, ?)")
+    rows = [(None, "null key"), (2, "two")]
+
+    with pytest.raises(ExecuteError):
+        await session.execute_many(prepared, rows, concurrency=1)
+
+    # The failure is seen before the next row is submitted.
+    result = await session.execute(f"SELECT id FROM {table}")
+    assert await result.all() == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.requires_db
+async def test_execute_many_raises_type_error_for_invalid_row_type(session: Session, table_factory: TableFactory):
+    table = await table_factory("id int PRIMARY KEY", "execute_many_row_type_table")
+
+    prepared = await session.prepare(f"INSERT INTO {table} (id) VALUES (?)")
+    rows = [(1,), 2, (3,)]
+
+    # Rows that are not a tuple, list or mapping are not wrapped in ExecuteError.
+    with pytest.raises(TypeError, match="Invalid row type"):
+        await session.execute_many(prepared, rows, concurrency=1)
+
+    result = await session.execute(f"SELECT id FROM {table}")
+    assert [row["id"] for row in await result.all()] == [1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.requires_db
+async def test_execute_many_rejects_zero_concurrency(session: Session):
+    prepared = await session.prepare("SELECT * FROM system.local")
+
+    with pytest.raises(ValueError):
+        await session.execute_many(prepared, [], concurrency=0)
@@ -193,9 +193,7 @@ async def test_custom_address_translator_discovery():
 
     translated_ips = [str(p.untranslated_address[0]) for p in translator.call_log]
 
-    print(f"Nodes seen by translator: {translated_ips}")
-
-    assert "127.0.0.3" in translated_ips or "127.0.0.4" in translated_ips
+    assert "127.0.0.3" in translated_ips or "127.0.0.4" in translated_ips, f"Nodes seen by translator: {translated_ips}"
 
 
 @pytest.mark.asyncio
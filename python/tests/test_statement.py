@@ -1,36 +1,40 @@
 from typing import Any, cast
 
 import pytest
+import pytest_asyncio
 from scylla.enums import Consistency, SerialConsistency
 from scylla.errors import PrepareError, StatementConfigError, StatementConversionError
 from scylla.execution_profile import ExecutionProfile
+from scylla.session import Session
 from scylla.session_builder import SessionBuilder
 from scylla.statement import PreparedStatement, Statement
 from scylla.types import Unset
 
 
+@pytest_asyncio.fixture(scope="module")
+async def session():
+    return await SessionBuilder().contact_points([("127.0.0.2", 9042)]).connect()
+
+
 @pytest.mark.asyncio
 @pytest.mark.requires_db
-async def test_prepare_statement_with_str():
-    session = await SessionBuilder().contact_points([("127.0.0.2", 9042)]).connect()
+async def test_prepare_statement_with_str(session: Session):
     prepared = await session.prepare("SELECT * FROM system.local")
-    print(prepared)
+    assert isinstance(prepared, PreparedStatement)
 
 
 @pytest.mark.asyncio
 @pytest.mark.requires_db
-async def test_prepare_statement_with_statement():
-    session = await SessionBuilder().contact_points([("127.0.0.2", 9042)]).connect()
+async def test_prepare_statement_with_statement(session: Session):
     statement = Statement("SELECT * FROM system.local")
     assert isinstance(statement, Statement)
     prepared = await session.prepare(statement)
-    print(prepared)
+    assert isinstance(prepared, PreparedStatement)
 
 
 @pytest.mark.asyncio
 @pytest.mark.requires_db
-async def test_prepare_and_execute():
-    session = await SessionBuilder().contact_points([("127.0.0.2", 9042)]).connect()
+async def test_prepare_and_execute(session: Session):
     query_str = "SELECT cluster_name FROM system.local"
     prepare_with_statement = await session.prepare(Statement(query_str))
     prepared_with_str = await session.prepare(query_str)
@@ -48,8 +52,7 @@ async def test_prepare_and_execute():
 
 @pytest.mark.asyncio
 @pytest.mark.requires_db
-async def test_prepare_and_str():
-    session = await SessionBuilder().contact_points([("127.0.0.2", 9042)]).connect()
+async def test_prepare_and_str(session: Session):
     query_str = "SELECT cluster_name FROM system.local;"
     statement = Statement(query_str)
     prepared = await session.prepare(query_str)
@@ -85,9 +88,7 @@ def test_statement_with_page_size():
 
 @pytest.mark.asyncio
 @pytest.mark.requires_db
-async def test_prepare_prepared_statement_raises_session_query_error():
-    session = await SessionBuilder().contact_points([("127.0.0.2", 9042)]).connect()
-
+async def test_prepare_prepared_statement_raises_session_query_error(session: Session):
     prepared = await session.prepare("SELECT * FROM system.local")
 
     with pytest.raises(PrepareError) as exc_info:
@@ -98,9 +99,7 @@ async def test_prepare_prepared_statement_raises_session_query_error():
 
 @pytest.mark.asyncio
 @pytest.mark.requires_db
-async def test_prepare_invalid_query_raises_session_query_error():
-    session = await SessionBuilder().contact_points([("127.0.0.2", 9042)]).connect()
-
+async def test_prepare_invalid_query_raises_session_query_error(session: Session):
     with pytest.raises(PrepareError) as exc_info:
         await session.prepare("THIS IS NOT CQL")
 
@@ -109,9 +108,7 @@ async def test_prepare_invalid_query_raises_session_query_error():
 
 @pytest.mark.asyncio
 @pytest.mark.requires_db
-async def test_prepare_invalid_statement_type_raises_statement_conversion_error():
-    session = await SessionBuilder().contact_points([("127.0.0.2", 9042)]).connect()
-
+async def test_prepare_invalid_statement_type_raises_statement_conversion_error(session: Session):
     with pytest.raises(StatementConversionError) as exc_info:
         await session.prepare(123)  # type: ignore[arg-type]
 
@@ -121,9 +118,7 @@ async def test_prepare_invalid_statement_type_raises_statement_conversion_error(
 
 @pytest.mark.asyncio
 @pytest.mark.requires_db
-async def test_execute_invalid_statement_type_raises_statement_conversion_error():
-    session = await SessionBuilder().contact_points([("127.0.0.2", 9042)]).connect()
-
+async def test_execute_invalid_statement_type_raises_statement_conversion_error(session: Session):
     with pytest.raises(StatementConversionError) as exc_info:
         await session.execute(cast(Any, 123))
 
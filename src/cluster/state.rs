@@ -20,6 +20,8 @@ pub(crate) struct PyClusterState {
     pub(crate) _inner: Arc<ClusterState>,
     /// Invariant: Always contains all known nodes by the Rust Driver
     pub(crate) known_nodes: Py<PyDict>,
+    /// Read-only view over `known_nodes`, built once per snapshot.
+    nodes_info: Py<PyMappingProxy>,
     pub(crate) keyspaces: Cache<String, PyKeyspace>,
 }
 
@@ -27,16 +29,18 @@ impl TryFrom<Arc<ClusterState>> for PyClusterState {
     type Error = PyErr;
 
     fn try_from(inner: Arc<ClusterState>) -> Result<Self, Self::Error> {
-        let known_nodes = Python::attach(|py| {
+        let (known_nodes, nodes_info) = Python::attach(|py| {
             let dict = PyDict::new(py);
             for node in inner.get_nodes_info().iter() {
                 dict.set_item(node.host_id, PyNode::from(Arc::clone(node)))?
             }
-            Ok::<Py<PyDict>, PyErr>(dict.unbind())
+            let view = PyMappingProxy::new(py, dict.as_mapping()).unbind();
+            Ok::<(Py<PyDict>, Py<PyMappingProxy>), PyErr>((dict.unbind(), view))
         })?;
         Ok(Self {
             _inner: inner,
             known_nodes,
+            nodes_info,
             keyspaces: Cache::new(),
         })
     }
@@ -74,7 +78,7 @@ impl PyClusterState {
 
     #[getter]
     fn get_nodes_info<'py>(&self, py: Python<'py>) -> Bound<'py, PyMappingProxy> {
-        PyMappingProxy::new(py, self.known_nodes.bind(py).as_mapping())
+        self.nodes_info.bind(py).clone()
     }
 
     fn compute_token(
@@ -94,7 +98,8 @@ impl PyClusterState {
         token: &PyToken,
         py: Python<'py>,
     ) -> PyResult<Bound<'py, PyList>> {
-        let token_endpoints_sequence = self
+        // Collect first so the list is allocated once with its final length.
+        let token_endpoints = self
             ._inner
             .get_token_endpoints(keyspace, table, token._inner)
             .into_iter()
@@ -103,13 +108,9 @@ impl PyClusterState {
                 let py_node =
                     py_node.expect("node can't be known by Rust Driver and simultaneously None");
                 Ok((py_node, shard))
-            });
-        let list = PyList::empty(py);
-        for token_endpoint in token_endpoints_sequence {
-            let (py_node, shard) = token_endpoint?;
-            list.append((py_node, shard))?;
-        }
-        Ok(list)
+            })
+            .collect::<PyResult<Vec<_>>>()?;
+        PyList::new(py, token_endpoints)
     }
 
     fn get_endpoints<'py>(
@@ -119,7 +120,8 @@ impl PyClusterState {
         partition_key: PyValueList,
         py: Python<'py>,
     ) -> Result<Bound<'py, PyList>, DriverClusterStateTokenError> {
-        let endpoints_sequence = self
+        // Collect first so the list is allocated once with its final length.
+        let endpoints = self
             ._inner
             .get_endpoints(keyspace, table, &partition_key)?
             .into_iter()
@@ -134,14 +136,9 @@ impl PyClusterState {
                         .expect("node can't be known by Rust Driver and simultaneously None");
                     Ok((py_node, shard))
                 },
-            );
-        let list = PyList::empty(py);
-        for endpoint in endpoints_sequence {
-            let (py_node, shard) = endpoint?;
-            list.append((py_node, shard))
-                .map_err(DriverClusterStateTokenError::python_conversion_failed)?;
-        }
-        Ok(list)
+            )
+            .collect::<Result<Vec<_>, _>>()?;
+        PyList::new(py, endpoints).map_err(DriverClusterStateTokenError::python_conversion_failed)
     }
 
     #[getter]
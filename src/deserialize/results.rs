@@ -1,7 +1,6 @@
 use crate::deserialize::value::{PyDeserializeValue, PyDeserializedValue};
 use crate::errors::{DriverDeserializationError, DriverExecuteError, DriverRowIterationError};
-use crate::serialize::value_list::PyValueList;
-use crate::session::{ExecutableStatement, PySession};
+use crate::session::{PagedRequest, PySession, SinglePageResult};
 use pyo3::exceptions::{PyRuntimeError, PyStopAsyncIteration, PyStopIteration};
 use pyo3::prelude::{PyDictMethods, PyListMethods, PyModule, PyModuleMethods};
 use pyo3::types::{PyDict, PyList, PyString, PyTuple};
@@ -19,6 +18,7 @@ use std::iter::Enumerate;
 use std::ops::Deref;
 use std::sync::Arc;
 use tokio::sync::Mutex;
+use tokio::task::JoinSet;
 use yoke::{Yoke, Yokeable};
 
 /// Database query result with paging support.
@@ -109,6 +109,31 @@ impl RequestResult {
         SinglePageIterator::new(py, self.query_result.clone(), self.row_factory.clone())
     }
 
+    /// Returns all rows in the current page as a list.
+    ///
+    /// Materializes the whole page in a single call instead of
+    /// returning to Python for every row like `iter_current_page()`.
+    /// Does not fetch additional pages.
+    ///
+    /// # Returns
+    ///
+    /// A list containing rows of the current page as Python objects.
+    ///
+    /// # Errors
+    ///
+    /// Returns an error if deserialization fails.
+    fn current_page<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyList>> {
+        let rows_iterator =
+            RowsIteratorKind::new(py, self.query_result.clone(), self.row_factory.clone())?;
+
+        let mut rows = Vec::new();
+        while let Some(res_row) = rows_iterator.next(py) {
+            rows.push(res_row?);
+        }
+
+        PyList::new(py, rows)
+    }
+
     /// Returns an async iterator over all rows with automatic paging.
     ///
     /// Creates an `AsyncRowsIterator` that transparently fetches
@@ -176,9 +201,17 @@ impl RequestResult {
 
         // Drain all rows from the current page, then fetch the next page.
         // This is done to hold the GIL for longer and avoid frequent reacquisition.
+        //
+        // Every page is consumed here, so the next page is requested before
+        // draining the current one. This overlaps the round-trip with deserialization,
+        // unless sending the request needs the GIL held by the drain.
+        // Dropping `prefetch` on error aborts a request that is still running.
 
+        let mut prefetch = JoinSet::new();
         let mut next_page: Option<QueryResult> = None;
         loop {
+            let prefetching = query_pager_clone.spawn_next_page(&mut prefetch);
+
             Python::attach(|py| -> PyResult<()> {
                 if let Some(next_page) = next_page.take() {
                     rows_iterator.update(py, Arc::new(next_page))?;
@@ -191,7 +224,15 @@ impl RequestResult {
                 Ok(())
             })?;
 
-            if let Some(res) = query_pager_clone.fetch_next_page().await {
+            if prefetching {
+                let (query_result, paging_response) = prefetch
+                    .join_next()
+                    .await
+                    .expect("the next page was spawned")
+                    .map_err(DriverExecuteError::from)??;
+                query_pager_clone.advance(paging_response);
+                next_page = Some(query_result);
+            } else if let Some(res) = query_pager_clone.fetch_next_page().await {
                 next_page = Some(res?);
             } else {
                 break;
@@ -412,6 +453,9 @@ impl RowColumnCursor {
 
         // Pre-create Python strings for column names — they are
         // identical for every row and can be reused via clone_ref.
+        //
+        // Names are interned, so every page reuses the same string objects
+        // and `row["name"]` lookups with literal keys match by identity.
         let column_names: Vec<Py<PyString>> = {
             let raw_rows_with_metadata = cart.deserialized_metadata_and_rows().expect(
                 "deserialized_metadata_and_rows can't be None after is_rows() returned true",
@@ -420,7 +464,7 @@ impl RowColumnCursor {
                 .metadata()
                 .col_specs()
                 .iter()
-                .map(|spec| PyString::new(py, spec.name()).unbind())
+                .map(|spec| PyString::intern(py, spec.name()).unbind())
                 .collect()
         };
 
@@ -452,6 +496,22 @@ impl RowColumnCursor {
         &mut self,
         py: Python<'_>,
     ) -> Option<Result<Column, DriverDeserializationError>> {
+        let next = self.next_value(py)?;
+
+        Some(next.map(|(column_index, value)| Column {
+            column_name: Py::clone_ref(&self.column_names[column_index], py),
+            value,
+        }))
+    }
+
+    /// Advances to the next column and deserializes its value.
+    ///
+    /// Unlike `next_column` this does not touch the cached column names,
+    /// for factories that only need values in column order.
+    fn next_value(
+        &mut self,
+        py: Python<'_>,
+    ) -> Option<Result<(usize, PyDeserializedValue), DriverDeserializationError>> {
         if let Err(err) = self
             .yoked
             .with_mut_return(|view: &mut Cursor<'_>| view.next_column())
@@ -475,9 +535,7 @@ impl RowColumnCursor {
             }
         };
 
-        let column_name = Py::clone_ref(&self.column_names[*column_index], py);
-
-        Some(Ok(Column { column_name, value }))
+        Some(Ok((*column_index, value)))
     }
 }
 
@@ -580,6 +638,68 @@ impl RowFactory {
     }
 }
 
+/// Row factory building each row as a Python `tuple`.
+///
+/// Values are placed in the order of columns in the result metadata.
+/// Compared to the default factory this skips allocating a `dict` and
+/// inserting column name keys for every row.
+#[pyclass(extends = RowFactory, frozen)]
+pub struct TupleRowFactory {}
+
+#[pymethods]
+impl TupleRowFactory {
+    /// Create a new `TupleRowFactory`.
+    #[new]
+    pub fn new() -> (Self, RowFactory) {
+        (TupleRowFactory {}, RowFactory {})
+    }
+
+    /// Build a Python `tuple` representing a single row.
+    ///
+    /// Parameters
+    /// ----------
+    /// column_iterator : RowColumnCursor
+    ///     Iterator over columns of the current row.
+    ///
+    /// Returns
+    /// -------
+    /// tuple
+    ///     Deserialized Python values in column order.
+    ///
+    /// Raises
+    /// ------
+    /// DeserializationError
+    ///     If any column cannot be deserialized into a Python object.
+    /// RowIterationError
+    ///     If building the Python row object fails (with original error attached).
+    pub fn build<'py>(
+        &self,
+        py: Python<'py>,
+        column_iterator: &Bound<'py, RowColumnCursor>,
+    ) -> Result<Py<PyTuple>, DriverRowIterationError> {
+        Self::build_tuple(py, column_iterator)
+    }
+}
+
+impl TupleRowFactory {
+    fn build_tuple<'py>(
+        py: Python<'py>,
+        column_iterator: &Bound<'py, RowColumnCursor>,
+    ) -> Result<Py<PyTuple>, DriverRowIterationError> {
+        let mut columns = column_iterator.borrow_mut();
+
+        let mut values = Vec::with_capacity(columns.column_names.len());
+        while let Some(next) = columns.next_value(py) {
+            let (_, value) = next.map_err(DriverRowIterationError::Deserialization)?;
+            values.push(value);
+        }
+
+        PyTuple::new(py, values)
+            .map(Bound::unbind)
+            .map_err(DriverRowIterationError::PythonError)
+    }
+}
+
 /// Determines how to iterate over query results based on result type.
 ///
 /// Dispatches to either row iteration or handles non-row results.
@@ -587,11 +707,51 @@ impl RowFactory {
 enum RowsIteratorKind {
     Rows {
         row_col_cursor: Py<RowColumnCursor>,
-        factory: Option<Py<RowFactory>>,
+        builder: RowBuilder,
     },
     NonRows,
 }
 
+/// How rows are materialized, resolved once from the user supplied factory.
+///
+/// Built-in factories are built directly in Rust. Only user subclasses
+/// go through a Python `build()` call for every row.
+#[derive(Clone)]
+enum RowBuilder {
+    Dict,
+    Tuple,
+    Python(Py<RowFactory>),
+}
+
+impl RowBuilder {
+    fn new(py: Python<'_>, factory: Option<Py<RowFactory>>) -> Self {
+        match factory {
+            None => RowBuilder::Dict,
+            Some(f) if f.bind(py).is_exact_instance_of::<RowFactory>() => RowBuilder::Dict,
+            Some(f) if f.bind(py).is_exact_instance_of::<TupleRowFactory>() => RowBuilder::Tuple,
+            Some(f) => RowBuilder::Python(f),
+        }
+    }
+
+    fn build<'py>(
+        &self,
+        py: Python<'py>,
+        column_iterator: &Bound<'py, RowColumnCursor>,
+    ) -> Result<Py<PyAny>, DriverRowIterationError> {
+        match self {
+            RowBuilder::Dict => RowFactory::default_instance()
+                .build(py, column_iterator)
+                .map(|d| d.into_any()),
+            RowBuilder::Tuple => {
+                TupleRowFactory::build_tuple(py, column_iterator).map(|t| t.into_any())
+            }
+            RowBuilder::Python(f) => f
+                .call_method1(py, "build", (column_iterator,))
+                .map_err(DriverRowIterationError::PythonError),
+        }
+    }
+}
+
 impl RowsIteratorKind {
     fn new(
         py: Python<'_>,
@@ -606,7 +766,7 @@ impl RowsIteratorKind {
 
         Ok(RowsIteratorKind::Rows {
             row_col_cursor,
-            factory,
+            builder: RowBuilder::new(py, factory),
         })
     }
 
@@ -621,7 +781,7 @@ impl RowsIteratorKind {
         match self {
             RowsIteratorKind::Rows {
                 row_col_cursor,
-                factory,
+                builder,
             } => {
                 let res = row_col_cursor
                     .borrow_mut(py)
@@ -631,18 +791,7 @@ impl RowsIteratorKind {
                 let cursor_bound = row_col_cursor.bind(py);
 
                 match res {
-                    Ok(()) => {
-                        let out: Result<Py<PyAny>, DriverRowIterationError> = match factory {
-                            None => RowFactory::default_instance()
-                                .build(py, cursor_bound)
-                                .map(|d| d.into_any()),
-                            Some(f) => f
-                                .call_method1(py, "build", (&cursor_bound,))
-                                .map_err(DriverRowIterationError::PythonError),
-                        };
-
-                        Some(out)
-                    }
+                    Ok(()) => Some(builder.build(py, cursor_bound)),
                     Err(err) => Some(Err(DriverRowIterationError::Deserialization(
                         DriverDeserializationError::scylla_decode_failed(err),
                     ))),
@@ -663,8 +812,7 @@ pub(crate) enum Pager {
     Paged {
         paging_response: PagingStateResponse,
         session: PySession,
-        query_request: ExecutableStatement,
-        value_list: PyValueList,
+        request: PagedRequest,
     },
 }
 
@@ -676,14 +824,12 @@ impl Pager {
     pub(crate) fn paged(
         paging_response: PagingStateResponse,
         session: PySession,
-        query_request: ExecutableStatement,
-        value_list: PyValueList,
+        request: PagedRequest,
     ) -> Self {
         Pager::Paged {
             paging_response,
             session,
-            query_request,
-            value_list,
+            request,
         }
     }
 
@@ -717,8 +863,7 @@ impl Pager {
         let Pager::Paged {
             paging_response,
             session,
-            query_request,
-            value_list,
+            request,
         } = self
         else {
             return None;
@@ -729,9 +874,7 @@ impl Pager {
             PagingStateResponse::NoMorePages => return None,
         };
 
-        let result = session
-            .execute_single_page(state, query_request.clone(), value_list.clone())
-            .await;
+        let result = session.execute_single_page(state, request.clone()).await;
 
         let (query_result, new_paging_response) = match result {
             Ok(v) => v,
@@ -742,6 +885,43 @@ impl Pager {
 
         Some(Ok(query_result))
     }
+
+    /// Starts fetching the next page into `tasks`, without waiting for it.
+    ///
+    /// Returns `false` if there are no more pages, or if sending the request
+    /// would attach to the Python interpreter. The caller must then pass the
+    /// fetched page's paging response to `advance`.
+    fn spawn_next_page(&self, tasks: &mut JoinSet<SinglePageResult>) -> bool {
+        let Pager::Paged {
+            paging_response: PagingStateResponse::HasMorePages { state },
+            session,
+            request,
+        } = self
+        else {
+            return false;
+        };
+
+        if request.needs_python() {
+            return false;
+        }
+
+        let (state, request) = (state.clone(), request.clone());
+        session.session_spawn_in_set(tasks, async move |s| {
+            request.execute_single_page(&s, state).await
+        });
+
+        true
+    }
+
+    /// Moves past a page fetched by `spawn_next_page`.
+    fn advance(&mut self, new_paging_response: PagingStateResponse) {
+        if let Pager::Paged {
+            paging_response, ..
+        } = self
+        {
+            *paging_response = new_paging_response;
+        }
+    }
 }
 
 /// Stable cart holding deserialized metadata and raw row data.
@@ -804,6 +984,7 @@ impl<'a> Cursor<'a> {
 #[pymodule]
 pub(crate) fn results(_py: Python<'_>, module: &Bound<'_, PyModule>) -> PyResult<()> {
     module.add_class::<RowFactory>()?;
+    module.add_class::<TupleRowFactory>()?;
     module.add_class::<Column>()?;
     module.add_class::<RowColumnCursor>()?;
     module.add_class::<SinglePageIterator>()?;
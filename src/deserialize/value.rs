@@ -291,6 +291,11 @@ where
             return Ok(PyDeserializedValue::none(py));
         };
 
+        if let Some(list) = deserialize_fixed_width_vector(typ, val, py) {
+            let list = list.map_err(DriverDeserializationError::python_conversion_failed)?;
+            return Ok(PyDeserializedValue::new(list.into_any()));
+        }
+
         let vector_iterator =
             VectorIterator::<FrameSliceWithMetadata<'frame, 'metadata>>::deserialize(
                 typ,
@@ -320,6 +325,54 @@ where
     }
 }
 
+/// Decodes a vector of fixed-width numbers directly from the frame.
+///
+/// Elements of such vectors are laid out back to back without length
+/// prefixes, so the slice is split into equal chunks and each one is decoded
+/// with `from_be_bytes`, skipping per-element type dispatch.
+///
+/// Returns `None` if the element type has no fast path or the slice length
+/// does not match the dimensions; the generic path then reports the error.
+fn deserialize_fixed_width_vector<'py>(
+    typ: &ColumnType<'_>,
+    v: FrameSlice<'_>,
+    py: Python<'py>,
+) -> Option<PyResult<Bound<'py, PyList>>> {
+    let ColumnType::Vector {
+        typ: element_type,
+        dimensions,
+    } = typ
+    else {
+        return None;
+    };
+
+    let bytes = v.as_slice();
+    let dimensions = usize::from(*dimensions);
+
+    fn chunks<const N: usize>(bytes: &[u8]) -> impl ExactSizeIterator<Item = [u8; N]> + '_ {
+        bytes
+            .chunks_exact(N)
+            .map(|chunk| chunk.try_into().expect("chunks_exact yields N-byte chunks"))
+    }
+
+    match element_type.as_ref() {
+        Native(NativeType::Float) if bytes.len() == dimensions * 4 => Some(PyList::new(
+            py,
+            chunks::<4>(bytes).map(|b| f32::from_be_bytes(b) as f64),
+        )),
+        Native(NativeType::Double) if bytes.len() == dimensions * 8 => {
+            Some(PyList::new(py, chunks::<8>(bytes).map(f64::from_be_bytes)))
+        }
+        Native(NativeType::Int) if bytes.len() == dimensions * 4 => {
+            Some(PyList::new(py, chunks::<4>(bytes).map(i32::from_be_bytes)))
+        }
+        Native(NativeType::BigInt) if bytes.len() == dimensions * 8 => {
+            Some(PyList::new(py, chunks::<8>(bytes).map(i64::from_be_bytes)))
+        }
+        _ => None,
+    }
+}
+
 fn deser_cql_py_value<'py, 'metadata, 'frame>(
     py: Python<'py>,
     typ: &'metadata ColumnType<'metadata>,
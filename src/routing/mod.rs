@@ -118,16 +118,19 @@ impl PyReplicaLocator {
             .replica_locator()
             .replicas_for_token(token._inner, &strategy._inner, datacenter, &table_spec);
 
-        let list = PyList::empty(py);
         let py_cs = self._inner.bind(py).get();
 
-        for (node, shard) in replica_set {
-            let py_node = py_cs.known_nodes.bind(py).get_item(node.host_id)?;
-            let py_node =
-                py_node.expect("node can't be known by Rust Driver and simultaneously None");
-            list.append((py_node, shard))?;
-        }
-        Ok(list)
+        // Collect first so the list is allocated once with its final length.
+        let replicas = replica_set
+            .into_iter()
+            .map(|(node, shard)| -> PyResult<(Bound<'py, PyAny>, Shard)> {
+                let py_node = py_cs.known_nodes.bind(py).get_item(node.host_id)?;
+                let py_node =
+                    py_node.expect("node can't be known by Rust Driver and simultaneously None");
+                Ok((py_node, shard))
+            })
+            .collect::<PyResult<Vec<_>>>()?;
+        PyList::new(py, replicas)
     }
 
     fn unique_token_owning_nodes_in_cluster<'py>(
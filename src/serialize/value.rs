@@ -11,8 +11,12 @@ use chrono::{DateTime, NaiveDate, NaiveTime, Utc};
 use uuid::Uuid;
 
 use pyo3::Bound;
+use pyo3::exceptions::PyAttributeError;
+use pyo3::intern;
 use pyo3::prelude::*;
-use pyo3::types::{PyAny, PyBytes, PyDict, PyInt, PyList, PyMapping, PySet, PyString, PyTuple};
+use pyo3::types::{
+    PyAny, PyBool, PyBytes, PyDict, PyInt, PyList, PyMapping, PySet, PyString, PyTuple,
+};
 
 use scylla::cluster::metadata::{CollectionType, ColumnType, NativeType, UserDefinedType};
 use scylla::serialize::SerializationError;
@@ -21,7 +25,7 @@ use scylla::serialize::value::{
     BuiltinTypeCheckErrorKind, MapSerializationErrorKind, SerializeValue,
     SetOrListSerializationErrorKind, UdtTypeCheckErrorKind,
 };
-use scylla::serialize::writers::{CellWriter, WrittenCellProof};
+use scylla::serialize::writers::{CellValueBuilder, CellWriter, WrittenCellProof};
 use scylla::value::{
     Counter, CqlDuration, CqlTime, CqlTimestamp, CqlTimeuuid, CqlValue, ValueOverflow,
 };
@@ -106,14 +110,13 @@ impl<'a, 'py> PyAnyWrapper<'a, 'py> {
                 }
             }
 
-            // Supports UDTs passed as Python dicts.
-            // For Python dataclass instances, convert to dict first (e.g., using dataclasses.asdict()).
+            // Supports UDTs passed as Python dicts or dataclass instances.
             ColumnType::UserDefinedType { definition, .. } => {
-                let Ok(dict) = PyUdtWrapper::new(self, definition) else {
+                let Ok(udt) = PyUdtWrapper::new(self, definition) else {
                     return Err(DriverSerializationError::type_mismatch(TypeExpected::Udt).into());
                 };
 
-                dict.serialize(typ, cell_writer)
+                udt.serialize(typ, cell_writer)
             }
 
             ColumnType::Tuple(elements_types) => {
@@ -141,9 +144,8 @@ impl<'a, 'py> PyAnyWrapper<'a, 'py> {
             NativeType::Int => self.serialize_int::<i32>(typ, cell_writer),
             NativeType::BigInt => self.serialize_int::<i64>(typ, cell_writer),
             NativeType::Counter => {
-                let value = self
-                    .cast::<PyInt>()
-                    .map_err(|_| self.mismatched_type_error::<Counter>(typ))?
+                let value = cast_int(self.0)
+                    .ok_or_else(|| self.mismatched_type_error::<Counter>(typ))?
                     .extract::<i64>()
                     .map_err(|_| DriverSerializationError::value_overflow())?;
 
@@ -316,8 +318,8 @@ impl<'a, 'py> PyAnyWrapper<'a, 'py> {
     {
         // The cast to `PyInt` is performed to distinguish between two different error cases:
         // `MismatchedType` and `ValueOverflow`.
-        self.cast::<PyInt>()
-            .map_err(|_| self.mismatched_type_error::<T>(typ))?
+        cast_int(self.0)
+            .ok_or_else(|| self.mismatched_type_error::<T>(typ))?
             .extract::<T>()
             .map_err(|_| DriverSerializationError::value_overflow())?
             .serialize(typ, cell_writer)
@@ -406,6 +408,14 @@ fn serialize_sequence<'t, 'b, 'py, T: Any>(
     builder.append_bytes(&element_count.to_be_bytes());
 
     for el in iter {
+        if encode_fixed_width_element(elt, &el, |bytes| {
+            builder
+                .make_sub_writer()
+                .set_value(bytes)
+                .expect("fixed-width values always fit in a cell");
+        }) {
+            continue;
+        }
         PyAnyWrapper::serialize(&PyAnyWrapper::new(&el), elt, builder.make_sub_writer()).map_err(
             |err| {
                 mk_ser_err::<T>(
@@ -439,6 +449,12 @@ pub fn serialize_vector<'t, 'b, 'py, T: Any>(
     match element_type.type_size_for_vector() {
         Some(_) => {
             for element in iter {
+                // Vector elements of fixed width have no length prefix.
+                if encode_fixed_width_element(element_type, &element, |bytes| {
+                    builder.append_bytes(bytes)
+                }) {
+                    continue;
+                }
                 serialize_next_constant_length_elem_unstable(
                     std::any::type_name::<T>(),
                     element_type,
@@ -466,6 +482,49 @@ pub fn serialize_vector<'t, 'b, 'py, T: Any>(
         .map_err(|_| mk_ser_err::<T>(typ, BuiltinSerializationErrorKind::SizeOverflow))
 }
 
+/// Encodes a fixed-width number as big-endian bytes and passes them to `write`.
+///
+/// Used by lists, sets and vectors of `int`, `bigint`, `float` and `double`
+/// to skip per-element type dispatch and sub-writer type checks.
+///
+/// Returns `false` if the element type has no fast path or the value cannot
+/// be extracted (e.g. it is `None`); the generic path then serializes it or
+/// reports the error.
+fn encode_fixed_width_element(
+    element_type: &ColumnType,
+    element: &Bound<'_, PyAny>,
+    write: impl FnOnce(&[u8]),
+) -> bool {
+    let encoded = match element_type {
+        ColumnType::Native(NativeType::Float) => element
+            .extract::<f32>()
+            .ok()
+            .map(|v| write(&v.to_be_bytes())),
+        ColumnType::Native(NativeType::Double) => element
+            .extract::<f64>()
+            .ok()
+            .map(|v| write(&v.to_be_bytes())),
+        // Integers are cast to `PyInt` first, like in `serialize_int`.
+        ColumnType::Native(NativeType::Int) => cast_int(element)
+            .and_then(|v| v.extract::<i32>().ok())
+            .map(|v| write(&v.to_be_bytes())),
+        ColumnType::Native(NativeType::BigInt) => cast_int(element)
+            .and_then(|v| v.extract::<i64>().ok())
+            .map(|v| write(&v.to_be_bytes())),
+        _ => None,
+    };
+
+    encoded.is_some()
+}
+
+/// Casts `value` to `PyInt`, rejecting `bool` even though it is an `int` subclass in Python.
+fn cast_int<'a, 'py>(value: &'a Bound<'py, PyAny>) -> Option<&'a Bound<'py, PyInt>> {
+    if value.is_instance_of::<PyBool>() {
+        return None;
+    }
+    value.cast::<PyInt>().ok()
+}
+
 #[derive(Debug)]
 struct PyListWrapper<'a, 'py> {
     inner: &'a Bound<'py, PyList>,
@@ -566,33 +625,51 @@ impl<'a, 'py> SerializeValue for PyMapWrapper<'a, 'py> {
 
         let mut builder = cell_writer.into_value_builder();
 
-        let items = self
-            .items()
-            .map_err(DriverSerializationError::python_interop_failed)?;
-
-        let element_count: i32 = items.len().try_into().map_err(|_| {
-            mk_ser_err::<PyMapping>(typ, MapSerializationErrorKind::TooManyElements)
-        })?;
-        builder.append_bytes(&element_count.to_be_bytes());
+        let element_count = |len: usize| -> Result<i32, SerializationError> {
+            len.try_into().map_err(|_| {
+                mk_ser_err::<PyMapping>(typ, MapSerializationErrorKind::TooManyElements)
+            })
+        };
 
-        for pair in items {
-            let (key, value) = pair
-                .extract::<(Bound<'py, PyAny>, Bound<'py, PyAny>)>()
-                .map_err(DriverSerializationError::python_interop_failed)?;
-            PyAnyWrapper::serialize(&PyAnyWrapper::new(&key), ktyp, builder.make_sub_writer())
+        let serialize_entry = |builder: &mut CellValueBuilder<'b>,
+                               key: &Bound<'py, PyAny>,
+                               value: &Bound<'py, PyAny>|
+         -> Result<(), SerializationError> {
+            PyAnyWrapper::serialize(&PyAnyWrapper::new(key), ktyp, builder.make_sub_writer())
                 .map_err(|err| {
                     mk_ser_err::<PyMapping>(
                         typ,
                         MapSerializationErrorKind::KeySerializationFailed(err),
                     )
                 })?;
-            PyAnyWrapper::serialize(&PyAnyWrapper::new(&value), vtyp, builder.make_sub_writer())
+            PyAnyWrapper::serialize(&PyAnyWrapper::new(value), vtyp, builder.make_sub_writer())
                 .map_err(|err| {
                     mk_ser_err::<PyMapping>(
                         typ,
                         MapSerializationErrorKind::ValueSerializationFailed(err),
                     )
                 })?;
+            Ok(())
+        };
+
+        // Plain dicts are iterated in place, without materializing
+        // `items()` as a list of (key, value) tuples.
+        if let Ok(dict) = self.as_any().cast_exact::<PyDict>() {
+            builder.append_bytes(&element_count(dict.len())?.to_be_bytes());
+            for (key, value) in dict.iter() {
+                serialize_entry(&mut builder, &key, &value)?;
+            }
+        } else {
+            let items = self
+                .items()
+                .map_err(DriverSerializationError::python_interop_failed)?;
+            builder.append_bytes(&element_count(items.len())?.to_be_bytes());
+            for pair in items {
+                let (key, value) = pair
+                    .extract::<(Bound<'py, PyAny>, Bound<'py, PyAny>)>()
+                    .map_err(DriverSerializationError::python_interop_failed)?;
+                serialize_entry(&mut builder, &key, &value)?;
+            }
         }
 
         builder
@@ -704,16 +781,18 @@ impl<'py, 'a> SerializeValue for PyTupleVectorWrapper<'py, 'a> {
     }
 }
 
-struct PyUdtWrapper<'py, 'a> {
-    inner: &'a Bound<'py, PyDict>,
-    definition: &'a Arc<UserDefinedType<'a>>,
+/// Python object holding the field values of a UDT.
+enum PyUdtFields<'a, 'py> {
+    /// A dict keyed by field name.
+    Dict(&'a Bound<'py, PyDict>),
+    /// A dataclass instance; fields are read as attributes, so nested
+    /// dataclasses do not have to be converted with `dataclasses.asdict()`.
+    Dataclass(&'a Bound<'py, PyAny>),
 }
 
-impl<'py> Deref for PyUdtWrapper<'py, '_> {
-    type Target = Bound<'py, PyDict>;
-    fn deref(&self) -> &Self::Target {
-        self.inner
-    }
+struct PyUdtWrapper<'py, 'a> {
+    fields: PyUdtFields<'a, 'py>,
+    definition: &'a Arc<UserDefinedType<'a>>,
 }
 
 impl<'py, 'a> PyUdtWrapper<'py, 'a> {
@@ -721,16 +800,60 @@ impl<'py, 'a> PyUdtWrapper<'py, 'a> {
         value: &PyAnyWrapper<'a, 'py>,
         definition: &'a Arc<UserDefinedType<'a>>,
     ) -> Result<Self, DriverSerializationError> {
-        let dict: &Bound<PyDict> = value
-            .cast::<PyDict>()
-            .map_err(|_| DriverSerializationError::type_mismatch(TypeExpected::Udt))?;
-        Ok(PyUdtWrapper {
-            inner: dict,
-            definition,
-        })
+        let fields = if let Ok(dict) = value.cast::<PyDict>() {
+            PyUdtFields::Dict(dict)
+        } else if is_dataclass_instance(value.0) {
+            PyUdtFields::Dataclass(value.0)
+        } else {
+            return Err(DriverSerializationError::type_mismatch(TypeExpected::Udt));
+        };
+
+        Ok(PyUdtWrapper { fields, definition })
+    }
+
+    fn get_field(&self, field_name: &str) -> PyResult<Option<Bound<'py, PyAny>>> {
+        match self.fields {
+            PyUdtFields::Dict(dict) => dict.get_item(field_name),
+            PyUdtFields::Dataclass(instance) => instance.getattr_opt(field_name),
+        }
+    }
+
+    /// Builds the error for a UDT field with no value, naming the Python type
+    /// that was actually passed.
+    fn missing_field_error(&self, typ: &ColumnType, field_name: &str) -> SerializationError {
+        match self.fields {
+            PyUdtFields::Dict(_) => mk_typck_err::<PyDict>(
+                typ,
+                UdtTypeCheckErrorKind::ValueMissingForUdtField {
+                    field_name: field_name.to_string(),
+                },
+            ),
+            PyUdtFields::Dataclass(instance) => {
+                let python_type_name = match instance.get_type().name() {
+                    Ok(name) => name.to_string(),
+                    Err(err) => {
+                        return DriverSerializationError::python_interop_failed(err).into();
+                    }
+                };
+                DriverSerializationError::python_interop_failed(PyAttributeError::new_err(format!(
+                    "{python_type_name} has no attribute for field '{field_name}' of UDT {}",
+                    self.definition.name
+                )))
+                .into()
+            }
+        }
     }
 }
 
+/// Checks whether the value is an instance of a dataclass, the same way
+/// `dataclasses.is_dataclass` does for instances.
+fn is_dataclass_instance(value: &Bound<'_, PyAny>) -> bool {
+    value
+        .get_type()
+        .hasattr(intern!(value.py(), "__dataclass_fields__"))
+        .unwrap_or(false)
+}
+
 impl<'py> SerializeValue for PyUdtWrapper<'py, '_> {
     fn serialize<'a>(
         &self,
@@ -741,17 +864,9 @@ impl<'py> SerializeValue for PyUdtWrapper<'py, '_> {
 
         for (field_name, field_type) in &self.definition.field_types {
             let item: Bound<PyAny> = self
-                .inner
-                .get_item(field_name)
+                .get_field(field_name)
                 .map_err(DriverSerializationError::python_interop_failed)?
-                .ok_or_else(|| {
-                    mk_typck_err::<PyDict>(
-                        typ,
-                        UdtTypeCheckErrorKind::ValueMissingForUdtField {
-                            field_name: field_name.to_string(),
-                        },
-                    )
-                })?;
+                .ok_or_else(|| self.missing_field_error(typ, field_name))?;
 
             PyAnyWrapper::new(&item)
                 .serialize_arbitrary_value(field_type, builder.make_sub_writer())?;
@@ -4,7 +4,7 @@ use std::any::Any;
 
 use pyo3::exceptions::{PyKeyError, PyTypeError};
 use pyo3::prelude::*;
-use pyo3::types::{PyList, PyMapping, PySequence, PyTuple};
+use pyo3::types::{PyDict, PyList, PyMapping, PySequence, PyTuple};
 use pyo3::{Bound, BoundObject, Py, PyAny};
 
 use scylla::frame::response::result::ColumnSpec;
@@ -31,9 +31,15 @@ impl SerializeRow for PyValueList {
         ctx: &RowSerializationContext<'_>,
         row_writer: &mut RowWriter,
     ) -> Result<(), SerializationError> {
-        Python::attach(|py| match self {
-            Self::Sequence(sequence) => serialize_sequence(sequence.bind(py), ctx, row_writer),
-            Self::Mapping(mapping) => serialize_mapping(mapping.bind(py), ctx, row_writer),
+        // Empty values are checked without attaching to the interpreter,
+        // as unprepared statements without values are serialized on runtime threads.
+        match self {
+            Self::Sequence(sequence) => {
+                Python::attach(|py| serialize_sequence(sequence.bind(py), ctx, row_writer))
+            }
+            Self::Mapping(mapping) => {
+                Python::attach(|py| serialize_mapping(mapping.bind(py), ctx, row_writer))
+            }
             Self::Empty => {
                 if ctx.columns().is_empty() {
                     Ok(())
@@ -50,7 +56,7 @@ impl SerializeRow for PyValueList {
                     }))
                 }
             }
-        })
+        }
     }
 
     fn is_empty(&self) -> bool {
@@ -135,11 +141,28 @@ fn serialize_sequence<'py>(
 
     length_equality_check::<PySequence>(len, ctx.columns().len())?;
 
+    // Rows are almost always lists or tuples: walk their items directly
+    // instead of going through the generic iterator protocol.
+    if let Ok(list) = value_list.as_any().cast::<PyList>() {
+        return serialize_elements(list.iter().map(Ok), ctx, row_writer);
+    }
+    if let Ok(tuple) = value_list.as_any().cast::<PyTuple>() {
+        return serialize_elements(tuple.iter().map(Ok), ctx, row_writer);
+    }
+
     let iter = value_list
         .try_iter()
         .map_err(DriverSerializationError::python_interop_failed)?;
 
-    for (index, (col, val)) in ctx.columns().iter().zip(iter).enumerate() {
+    serialize_elements(iter, ctx, row_writer)
+}
+
+fn serialize_elements<'py>(
+    values: impl Iterator<Item = PyResult<Bound<'py, PyAny>>>,
+    ctx: &RowSerializationContext<'_>,
+    row_writer: &mut RowWriter,
+) -> Result<(), SerializationError> {
+    for (index, (col, val)) in ctx.columns().iter().zip(values).enumerate() {
         let val = val.map_err(DriverSerializationError::python_interop_failed)?;
         serialize_element(col, &val, row_writer).map_err(|err| {
             DriverSerializationError::scylla_serialize_failed(err).at_parameter_index(index)
@@ -160,18 +183,31 @@ fn serialize_mapping<'py>(
         .map_err(DriverSerializationError::python_interop_failed)?;
     length_equality_check::<PyMapping>(dict_len, ctx.columns().len())?;
 
+    let value_missing = |col: &ColumnSpec| {
+        mk_typck_err_val_list::<PyMapping>(BuiltinTypeCheckErrorKind::ValueMissingForColumn {
+            name: col.name().into(),
+        })
+    };
+
+    // Plain dicts are read directly, without going through the mapping
+    // protocol or raising a KeyError for missing columns. Subclasses may
+    // override `__getitem__` or `__missing__`, so they use the generic path.
+    let dict = value_list.as_any().cast_exact::<PyDict>().ok();
+
     for col in ctx.columns().iter() {
-        let item: Bound<PyAny> = value_list.get_item(col.name()).map_err(|e| {
-            if e.is_instance_of::<PyKeyError>(py) {
-                mk_typck_err_val_list::<PyMapping>(
-                    BuiltinTypeCheckErrorKind::ValueMissingForColumn {
-                        name: col.name().into(),
-                    },
-                )
-            } else {
-                SerializationError::new(DriverSerializationError::python_interop_failed(e))
-            }
-        })?;
+        let item: Bound<PyAny> = match dict {
+            Some(dict) => dict
+                .get_item(col.name())
+                .map_err(DriverSerializationError::python_interop_failed)?
+                .ok_or_else(|| value_missing(col))?,
+            None => value_list.get_item(col.name()).map_err(|e| {
+                if e.is_instance_of::<PyKeyError>(py) {
+                    value_missing(col)
+                } else {
+                    SerializationError::new(DriverSerializationError::python_interop_failed(e))
+                }
+            })?,
+        };
         serialize_element(col, &item, row_writer).map_err(|err| {
             DriverSerializationError::scylla_serialize_failed(err).at_parameter_name(col.name())
         })?;
@@ -16,11 +16,18 @@ use pyo3::sync::MutexExt;
 use pyo3::types::PyString;
 use scylla::client::session::Session;
 use scylla::response::query_result::QueryResult;
+use scylla::serialize::row::SerializedValues;
 use scylla::statement::batch::BatchStatement;
 use scylla::statement::prepared::PreparedStatement;
 use scylla::statement::unprepared::Statement;
 use scylla_cql::frame::request::query::{PagingState, PagingStateResponse};
 use std::future::Future;
+use std::num::NonZeroUsize;
+use tokio::sync::Semaphore;
+use tokio::task::JoinSet;
+
+/// Default number of in-flight requests for `Session.execute_many`.
+const DEFAULT_EXECUTE_MANY_CONCURRENCY: NonZeroUsize = NonZeroUsize::new(256).unwrap();
 
 #[pyclass(name = "Session", frozen, skip_from_py_object)]
 #[derive(Clone)]
@@ -86,6 +93,89 @@ impl PySession {
         }
     }
 
+    #[pyo3(signature = (statement, values, /, *, concurrency=DEFAULT_EXECUTE_MANY_CONCURRENCY))]
+    async fn execute_many(
+        &self,
+        statement: Py<PyPreparedStatement>,
+        values: Py<PyAny>,
+        concurrency: NonZeroUsize,
+    ) -> PyResult<()> {
+        let prepared = statement.get()._inner.clone();
+        let rows = Python::attach(|py| values.bind(py).try_iter().map(Bound::unbind))?;
+
+        let permits = Arc::new(Semaphore::new(concurrency.get()));
+        // Dropping the set aborts requests that are still running, so no more
+        // rows are sent once the awaiting coroutine is cancelled.
+        let mut requests = JoinSet::new();
+        let mut first_error: Option<PyErr> = None;
+
+        loop {
+            // A failed request closes the semaphore before releasing its permit,
+            // so the loop cannot pick up a new slot after a failure.
+            let Ok(permit) = Arc::clone(&permits).acquire_owned().await else {
+                break;
+            };
+
+            // Stop submitting new rows as soon as any request fails.
+            while let Some(result) = requests.try_join_next() {
+                if let Err(err) = result.map_err(DriverExecuteError::from).and_then(|r| r) {
+                    first_error.get_or_insert(err.into());
+                }
+            }
+            if first_error.is_some() {
+                break;
+            }
+
+            // Rows are pulled and serialized here, on the thread polling this coroutine,
+            // rather than on the runtime's worker threads, which would block on the GIL.
+            // This only happens once a request slot is free, so at most `concurrency`
+            // rows are materialized at any time.
+            let next_row = Python::attach(|py| -> PyResult<Option<_>> {
+                let Some(row) = rows.bind(py).clone().next() else {
+                    return Ok(None);
+                };
+                let row: PyValueList = row?.extract()?;
+                let serialized_values = prepared
+                    .serialize_values_unstable(&row)
+                    .map_err(DriverExecuteError::serialization_failed)?;
+                Ok(Some(serialized_values))
+            });
+
+            let serialized_values = match next_row {
+                Ok(Some(serialized_values)) => serialized_values,
+                Ok(None) => break,
+                Err(err) => {
+                    first_error = Some(err);
+                    break;
+                }
+            };
+
+            let prepared = prepared.clone();
+            let permits = Arc::clone(&permits);
+            self.session_spawn_in_set(&mut requests, async move |s| {
+                let result = s
+                    .execute_unstable(&prepared, &serialized_values, false, PagingState::start())
+                    .await
+                    .map(|_| ())
+                    .map_err(DriverExecuteError::rust_driver_execution_error);
+                if result.is_err() {
+                    permits.close();
+                }
+                drop(permit);
+                result
+            });
+        }
+
+        // Let every request finish before reporting the first failure.
+        while let Some(result) = requests.join_next().await {
+            if let Err(err) = result.map_err(DriverExecuteError::from).and_then(|r| r) {
+                first_error.get_or_insert(err.into());
+            }
+        }
+
+        first_error.map_or(Ok(()), Err)
+    }
+
     async fn prepare(
         &self,
         statement: ExecutableStatement,
@@ -210,13 +300,14 @@ impl PySession {
             PagingState::start()
         };
 
+        let request = PagedRequest::new(statement, values)?;
         let (result, paging_response) = self
-            .execute_single_page(paging_state, statement.clone(), values.clone())
+            .execute_single_page(paging_state, request.clone())
             .await?;
 
         Ok(RequestResult::new(
             result,
-            Pager::paged(paging_response, self.clone(), statement, values),
+            Pager::paged(paging_response, self.clone(), request),
             factory,
         ))
     }
@@ -236,6 +327,21 @@ impl PySession {
         RUNTIME.spawn(async move { f(session_clone).await }).await?
     }
 
+    /// Spawns `f` on the runtime as a member of `tasks`.
+    ///
+    /// Unlike `session_spawn_on_runtime`, the task is not detached:
+    /// it is aborted if `tasks` is dropped before it completes.
+    pub(crate) fn session_spawn_in_set<F, Fut, R>(&self, tasks: &mut JoinSet<R>, f: F)
+    where
+        F: FnOnce(Arc<Session>) -> Fut + Send + 'static,
+        Fut: Future<Output = R> + Send + 'static,
+        R: Send + 'static,
+    {
+        let session_clone = Arc::clone(&self._inner);
+
+        tasks.spawn_on(async move { f(session_clone).await }, RUNTIME.handle());
+    }
+
     async fn scylla_prepare(
         &self,
         statement: impl Into<Statement>,
@@ -249,30 +355,12 @@ impl PySession {
     pub(crate) async fn execute_single_page(
         &self,
         paging_state: PagingState,
-        query_request: ExecutableStatement,
-        values: PyValueList,
-    ) -> Result<(QueryResult, PagingStateResponse), DriverExecuteError> {
-        match query_request {
-            ExecutableStatement::Prepared(p) => {
-                let serialized_values = p
-                    .serialize_values_unstable(&values)
-                    .map_err(DriverExecuteError::serialization_failed)?;
-                self.session_spawn_on_runtime(async move |s| {
-                    s.execute_unstable(&p, &serialized_values, true, paging_state)
-                        .await
-                        .map_err(DriverExecuteError::rust_driver_execution_error)
-                })
-                .await
-            }
-            ExecutableStatement::Unprepared(q) => {
-                self.session_spawn_on_runtime(async move |s| {
-                    s.query_single_page(q, values, paging_state)
-                        .await
-                        .map_err(DriverExecuteError::rust_driver_execution_error)
-                })
-                .await
-            }
-        }
+        request: PagedRequest,
+    ) -> SinglePageResult {
+        self.session_spawn_on_runtime(async move |s| {
+            request.execute_single_page(&s, paging_state).await
+        })
+        .await
     }
 }
 
@@ -313,6 +401,59 @@ impl<'py> FromPyObject<'_, 'py> for ExecutableStatement {
     }
 }
 
+/// A single page of results, along with the paging state to fetch the next one.
+pub(crate) type SinglePageResult = Result<(QueryResult, PagingStateResponse), DriverExecuteError>;
+
+/// Statement and values of a paged request, kept to fetch its following pages.
+#[derive(Clone)]
+pub(crate) enum PagedRequest {
+    /// Values bound to a prepared statement are serialized once, up front,
+    /// so fetching following pages does not need the GIL.
+    Prepared(PreparedStatement, SerializedValues),
+    /// Values bound to an unprepared statement are serialized by the Rust driver
+    /// while each page is being requested.
+    Unprepared(Statement, PyValueList),
+}
+
+impl PagedRequest {
+    pub(crate) fn new(
+        statement: ExecutableStatement,
+        values: PyValueList,
+    ) -> Result<Self, DriverExecuteError> {
+        match statement {
+            ExecutableStatement::Prepared(p) => {
+                let serialized_values = p
+                    .serialize_values_unstable(&values)
+                    .map_err(DriverExecuteError::serialization_failed)?;
+                Ok(Self::Prepared(p, serialized_values))
+            }
+            ExecutableStatement::Unprepared(q) => Ok(Self::Unprepared(q, values)),
+        }
+    }
+
+    /// Returns `true` if sending this request attaches to the Python interpreter.
+    pub(crate) fn needs_python(&self) -> bool {
+        matches!(self, Self::Unprepared(_, values) if !matches!(values, PyValueList::Empty))
+    }
+
+    pub(crate) async fn execute_single_page(
+        self,
+        session: &Session,
+        paging_state: PagingState,
+    ) -> SinglePageResult {
+        match self {
+            Self::Prepared(p, serialized_values) => session
+                .execute_unstable(&p, &serialized_values, true, paging_state)
+                .await
+                .map_err(DriverExecuteError::rust_driver_execution_error),
+            Self::Unprepared(q, values) => session
+                .query_single_page(q, values, paging_state)
+                .await
+                .map_err(DriverExecuteError::rust_driver_execution_error),
+        }
+    }
+}
+
 impl From<ExecutableStatement> for BatchStatement {
     fn from(s: ExecutableStatement) -> Self {
         match s {